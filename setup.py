@@ -7,7 +7,8 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "boto3>=1.26.0",
-        "openai>=1.0.0",
+        "openai>=1.17.0",
+        "httpx>=0.23.0",
         "python-dotenv>=0.19.0",
         "click>=8.0.0",
     ],
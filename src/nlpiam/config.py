@@ -1,4 +1,6 @@
+import math
 import os
+import warnings
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,4 +17,51 @@ DEFAULT_PATH = '/'
 FORCE_DESTROY = True  # Whether to force delete users even if they have attached resources
 
 # OpenAI configuration
-OPENAI_MODEL = "gpt-4o"
\ No newline at end of file
+OPENAI_MODEL = "gpt-4o"
+
+# HTTP transport configuration (shared by the boto3 and OpenAI clients)
+RETRY_MODES = ('legacy', 'standard', 'adaptive')
+
+def _env_number(name, default, cast, minimum, exclusive=False):
+    """Read a numeric setting, falling back to the default if it is missing or invalid"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+    valid = (number is not None and math.isfinite(number)
+             and (number > minimum if exclusive else number >= minimum))
+    if not valid:
+        warnings.warn(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+    return number
+
+def _env_bool(name, default):
+    """Read a true/false setting, falling back to the default if it is invalid"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    if value.lower() in ('1', 'true', 'yes'):
+        return True
+    if value.lower() in ('0', 'false', 'no'):
+        return False
+    warnings.warn(f"Ignoring invalid {name}={value!r}, expected true/false/1/0/yes/no; using {default}")
+    return default
+
+def _env_choice(name, default, choices):
+    """Read a setting restricted to a set of choices, falling back to the default"""
+    value = os.getenv(name, default).lower()
+    if value not in choices:
+        warnings.warn(f"Ignoring invalid {name}={value!r}, expected one of {', '.join(choices)}; using {default}")
+        return default
+    return value
+
+MAX_POOL_CONNECTIONS = _env_number('NLPIAM_MAX_POOL_CONNECTIONS', 10, int, 1)
+CONNECT_TIMEOUT = _env_number('NLPIAM_CONNECT_TIMEOUT', 5.0, float, 0, exclusive=True)
+READ_TIMEOUT = _env_number('NLPIAM_READ_TIMEOUT', 60.0, float, 0, exclusive=True)
+KEEPALIVE_EXPIRY = _env_number('NLPIAM_KEEPALIVE_EXPIRY', 30.0, float, 0, exclusive=True)  # Seconds an idle connection is kept open
+TCP_KEEPALIVE = _env_bool('NLPIAM_TCP_KEEPALIVE', True)
+RETRY_MODE = _env_choice('NLPIAM_RETRY_MODE', 'standard', RETRY_MODES)  # botocore retry mode
+MAX_RETRIES = _env_number('NLPIAM_MAX_RETRIES', 3, int, 0)
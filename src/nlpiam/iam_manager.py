@@ -1,19 +1,18 @@
-import boto3
 import json
 from typing import Dict, Tuple
-from openai import OpenAI
 from . import config
+from .utils.clients import client_registry
 
 class NaturalLanguageIAMManager:
     def __init__(self):
-        """Initialize the IAM manager with AWS client and OpenAI client."""
-        self.iam_client = boto3.client('iam',
+        """Initialize the IAM manager with shared, pooled AWS and OpenAI clients."""
+        self.iam_client = client_registry.get_aws_client('iam',
             aws_access_key_id=config.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
             region_name=config.AWS_DEFAULT_REGION
         )
         
-        self.openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self.openai_client = client_registry.get_openai_client(api_key=config.OPENAI_API_KEY)
         
         self.supported_actions = {
             'create_user': ['username'],
@@ -0,0 +1,223 @@
+import threading
+from typing import Dict, Optional
+
+import boto3
+import httpx
+from botocore.config import Config
+from openai import DefaultHttpxClient, OpenAI
+
+from .. import config
+
+class ClientRegistry:
+    def __init__(self,
+                 max_pool_connections: int = config.MAX_POOL_CONNECTIONS,
+                 connect_timeout: float = config.CONNECT_TIMEOUT,
+                 read_timeout: float = config.READ_TIMEOUT,
+                 keepalive_expiry: float = config.KEEPALIVE_EXPIRY,
+                 tcp_keepalive: bool = config.TCP_KEEPALIVE,
+                 retry_mode: str = config.RETRY_MODE,
+                 max_retries: int = config.MAX_RETRIES):
+        """Initialize a registry of pooled AWS and OpenAI clients"""
+        self.max_pool_connections = max_pool_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.tcp_keepalive = tcp_keepalive
+        self.retry_mode = retry_mode
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._clients = {}
+        self._labels = {}
+        self._acquisitions = {}
+        self._created = 0
+        self._generation = 0
+
+    def get_aws_client(self, service: str,
+                       aws_access_key_id: Optional[str] = None,
+                       aws_secret_access_key: Optional[str] = None,
+                       region_name: Optional[str] = None):
+        """Get the shared boto3 client for a service and set of credentials"""
+        aws_access_key_id = aws_access_key_id or config.AWS_ACCESS_KEY_ID
+        aws_secret_access_key = aws_secret_access_key or config.AWS_SECRET_ACCESS_KEY
+        region_name = region_name or config.AWS_DEFAULT_REGION
+
+        key = (service, aws_access_key_id, aws_secret_access_key, region_name)
+        label = f"{service}:{region_name}:{_mask(aws_access_key_id)}"
+        return self._get_or_create(key, label, lambda: boto3.session.Session().client(
+            service,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+            config=self._botocore_config()
+        ))
+
+    def get_openai_client(self, api_key: Optional[str] = None) -> OpenAI:
+        """Get the shared OpenAI client for an API key"""
+        api_key = api_key or config.OPENAI_API_KEY
+
+        key = ('openai', api_key)
+        label = f"openai:{_mask(api_key)}"
+        return self._get_or_create(key, label, lambda: OpenAI(
+            api_key=api_key,
+            max_retries=self.max_retries,
+            timeout=self._httpx_timeout(),
+            http_client=DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_pool_connections,
+                    max_keepalive_connections=self.max_pool_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+        ))
+
+    def stats(self) -> Dict[str, Dict]:
+        """Get pool utilization stats for every registered client
+
+        Every entry reports ``acquisitions``, ``reuses``,
+        ``max_pool_connections``, ``pools`` and ``idle_connections`` (open
+        connections currently parked in the pool). AWS entries add the
+        lifetime totals ``total_connections_opened`` and ``total_requests``;
+        OpenAI entries add the current counts ``open_connections`` and
+        ``active_connections``.
+        """
+        with self._lock:
+            entries = [(self._labels[key], key, client, self._acquisitions[key])
+                       for key, client in self._clients.items()]
+
+        stats = {}
+        for label, key, client, acquisitions in entries:
+            entry = {
+                'acquisitions': acquisitions,
+                'reuses': acquisitions - 1,
+                'max_pool_connections': self.max_pool_connections
+            }
+            if key[0] == 'openai':
+                entry.update(_httpx_pool_stats(client))
+            else:
+                entry.update(_urllib3_pool_stats(client))
+            stats[label] = entry
+        return stats
+
+    def clear(self):
+        """Close and forget all registered clients"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._generation += 1
+            self._clients.clear()
+            self._labels.clear()
+            self._acquisitions.clear()
+
+        for client in clients:
+            _close(client)
+
+    def _get_or_create(self, key, label, factory):
+        """Return the client registered under key, creating it on first use"""
+        with self._lock:
+            if key in self._clients:
+                self._acquisitions[key] += 1
+                return self._clients[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Build outside the registry lock so lookups of other clients never
+        # wait on a slow client construction; the per-key lock (kept across
+        # clear()) makes sure a given client is only built once.
+        with key_lock:
+            while True:
+                with self._lock:
+                    if key in self._clients:
+                        self._acquisitions[key] += 1
+                        return self._clients[key]
+                    generation = self._generation
+
+                client = factory()
+
+                with self._lock:
+                    if self._generation == generation:
+                        self._created += 1
+                        self._clients[key] = client
+                        self._labels[key] = f"{label}#{self._created}"
+                        self._acquisitions[key] = 1
+                        return client
+
+                # clear() ran while this client was being built; discard it
+                # like the clients clear() closed, then build a fresh one.
+                _close(client)
+
+    def _botocore_config(self) -> Config:
+        """Build the botocore transport config"""
+        return Config(
+            max_pool_connections=self.max_pool_connections,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            tcp_keepalive=self.tcp_keepalive,
+            retries={
+                'mode': self.retry_mode,
+                'total_max_attempts': self.max_retries + 1
+            }
+        )
+
+    def _httpx_timeout(self) -> httpx.Timeout:
+        """Build the httpx timeout used by the OpenAI client"""
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+def _close(client):
+    """Close a client, ignoring errors from already-closed transports"""
+    try:
+        client.close()
+    except Exception:
+        pass
+
+def _mask(value: Optional[str]) -> str:
+    """Mask a credential for display, keeping only its last four characters"""
+    if not value:
+        return 'default'
+    return '****' + value[-4:] if len(value) > 8 else '****'
+
+def _urllib3_pool_stats(client) -> Dict:
+    """Read connection pool usage from a boto3 client's urllib3 pool managers
+
+    urllib3 pre-fills each pool's queue with ``None`` placeholders up to its
+    maxsize, so only the real connection objects in it are counted as idle.
+    """
+    try:
+        http_session = client._endpoint.http_session
+        managers = [http_session._manager]
+        managers.extend(getattr(http_session, '_proxy_managers', {}).values())
+        pools = [manager.pools[pool_key]
+                 for manager in managers
+                 for pool_key in manager.pools.keys()]
+
+        idle = 0
+        for pool in pools:
+            if pool.pool is not None:
+                with pool.pool.mutex:
+                    idle += sum(1 for connection in pool.pool.queue if connection is not None)
+
+        return {
+            'pools': len(pools),
+            'idle_connections': idle,
+            'total_connections_opened': sum(pool.num_connections for pool in pools),
+            'total_requests': sum(pool.num_requests for pool in pools)
+        }
+    except Exception:
+        return {}
+
+def _httpx_pool_stats(client) -> Dict:
+    """Read current connection pool usage from an OpenAI client's httpx transport"""
+    try:
+        connections = list(client._client._transport._pool.connections)
+        idle = sum(1 for connection in connections if connection.is_idle())
+
+        return {
+            'pools': 1,
+            'idle_connections': idle,
+            'open_connections': len(connections),
+            'active_connections': len(connections) - idle
+        }
+    except Exception:
+        return {}
+
+# Process-wide registry shared by every NaturalLanguageIAMManager
+client_registry = ClientRegistry()
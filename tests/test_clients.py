@@ -0,0 +1,255 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from nlpiam import config
+from nlpiam.utils import clients
+from nlpiam.utils.clients import ClientRegistry
+
+class FakeClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+class FakeSession:
+    created = []
+    building = None
+    gate = None
+
+    def client(self, service, **kwargs):
+        time.sleep(0.01)  # Widen the window for concurrent construction
+        if FakeSession.gate is not None:
+            FakeSession.building.set()
+            FakeSession.gate.wait()
+        client = FakeClient(service=service, **kwargs)
+        FakeSession.created.append(client)
+        return client
+
+@pytest.fixture
+def registry(monkeypatch):
+    FakeSession.created = []
+    FakeSession.building = None
+    FakeSession.gate = None
+    monkeypatch.setattr(clients.boto3.session, 'Session', FakeSession)
+    monkeypatch.setattr(clients, 'OpenAI', FakeClient)
+    monkeypatch.setattr(clients, 'DefaultHttpxClient', FakeClient)
+    registry = ClientRegistry()
+    yield registry
+    registry.clear()
+
+def test_same_key_returns_same_client(registry):
+    first = registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+    second = registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+    assert first is second
+    assert len(FakeSession.created) == 1
+
+    assert registry.get_openai_client('sk-aaaa1234') is registry.get_openai_client('sk-aaaa1234')
+
+def test_different_credentials_or_region_return_different_clients(registry):
+    base = registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+    assert registry.get_aws_client('iam', 'AKIAEXAMPLE2', 'secret', 'us-east-1') is not base
+    assert registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'other', 'us-east-1') is not base
+    assert registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'eu-west-1') is not base
+    assert registry.get_aws_client('sts', 'AKIAEXAMPLE1', 'secret', 'us-east-1') is not base
+
+    assert registry.get_openai_client('sk-aaaa1234') is not registry.get_openai_client('sk-bbbb1234')
+
+def test_stats_counts_acquisitions_and_reuses(registry):
+    for _ in range(3):
+        registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+    registry.get_openai_client('sk-aaaa1234')
+
+    stats = registry.stats()
+    assert len(stats) == 2
+    iam = next(entry for label, entry in stats.items() if label.startswith('iam:'))
+    openai = next(entry for label, entry in stats.items() if label.startswith('openai:'))
+    assert (iam['acquisitions'], iam['reuses']) == (3, 2)
+    assert (openai['acquisitions'], openai['reuses']) == (1, 0)
+
+def test_stats_keeps_clients_with_matching_masked_labels(registry):
+    registry.get_openai_client('sk-aaaa1234')
+    registry.get_openai_client('sk-bbbb1234')
+    registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret-a', 'us-east-1')
+    registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret-b', 'us-east-1')
+
+    assert len(registry.stats()) == 4
+
+def test_stats_hides_credentials(registry):
+    registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'supersecret', 'us-east-1')
+    registry.get_openai_client('sk-aaaa1234')
+
+    labels = ' '.join(registry.stats())
+    assert 'AKIAEXAMPLE1' not in labels
+    assert 'supersecret' not in labels
+    assert 'sk-aaaa1234' not in labels
+
+def test_clear_closes_and_forgets_clients(registry):
+    aws = registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+    openai = registry.get_openai_client('sk-aaaa1234')
+
+    registry.clear()
+
+    assert aws.closed and openai.closed
+    assert registry.stats() == {}
+    assert registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1') is not aws
+
+def test_concurrent_acquisition_creates_one_client(registry):
+    barrier = threading.Barrier(8)
+    results = []
+
+    def acquire():
+        barrier.wait()
+        results.append(registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1'))
+
+    threads = [threading.Thread(target=acquire) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeSession.created) == 1
+    assert all(client is results[0] for client in results)
+    assert next(iter(registry.stats().values()))['acquisitions'] == 8
+
+def test_clear_during_construction_discards_stale_client(registry):
+    FakeSession.building = threading.Event()
+    FakeSession.gate = threading.Event()
+    results = []
+
+    def acquire():
+        results.append(registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1'))
+
+    builder = threading.Thread(target=acquire)
+    builder.start()
+    FakeSession.building.wait()
+    registry.clear()
+    waiter = threading.Thread(target=acquire)
+    waiter.start()
+    FakeSession.gate.set()
+    builder.join()
+    waiter.join()
+
+    stale, fresh = FakeSession.created
+    assert stale.closed and not fresh.closed
+    assert results == [fresh, fresh]
+    assert next(iter(registry.stats().values()))['acquisitions'] == 2
+
+def test_aws_client_receives_transport_config(registry):
+    registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+
+    botocore_config = FakeSession.created[0].kwargs['config']
+    assert botocore_config.max_pool_connections == registry.max_pool_connections
+    assert botocore_config.retries['mode'] == registry.retry_mode
+    assert botocore_config.retries['total_max_attempts'] == registry.max_retries + 1
+
+def test_openai_client_receives_transport_config(registry):
+    client = registry.get_openai_client('sk-aaaa1234')
+
+    assert client.kwargs['max_retries'] == registry.max_retries
+    timeout = client.kwargs['timeout']
+    assert timeout.connect == registry.connect_timeout
+    assert timeout.read == registry.read_timeout
+
+    http_client = client.kwargs['http_client']
+    assert 'timeout' not in http_client.kwargs
+    limits = http_client.kwargs['limits']
+    assert limits.max_connections == registry.max_pool_connections
+    assert limits.max_keepalive_connections == registry.max_pool_connections
+    assert limits.keepalive_expiry == registry.keepalive_expiry
+
+class ListUsersHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        body = (b'<ListUsersResponse xmlns="https://iam.amazonaws.com/doc/2010-05-08/">'
+                b'<ListUsersResult><Users/><IsTruncated>false</IsTruncated></ListUsersResult>'
+                b'<ResponseMetadata><RequestId>1</RequestId></ResponseMetadata>'
+                b'</ListUsersResponse>')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def test_real_botocore_pool_stats(monkeypatch):
+    monkeypatch.setenv('AWS_CONFIG_FILE', '/nonexistent')
+    registry = ClientRegistry(connect_timeout=1, max_retries=0)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ListUsersHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        # A failed connection creates the pool but leaves no idle connection
+        monkeypatch.setenv('AWS_ENDPOINT_URL_IAM', f'http://127.0.0.1:{_unused_port()}')
+        failing = registry.get_aws_client('iam', 'AKIAEXAMPLE1', 'secret', 'us-east-1')
+        with pytest.raises(Exception):
+            failing.list_users()
+
+        monkeypatch.setenv('AWS_ENDPOINT_URL_IAM', f'http://127.0.0.1:{server.server_port}')
+        working = registry.get_aws_client('iam', 'AKIAEXAMPLE2', 'secret', 'us-east-1')
+        working.list_users()
+        working.list_users()
+
+        stats = registry.stats()
+        failed = next(entry for label, entry in stats.items() if label.endswith('#1'))
+        kept = next(entry for label, entry in stats.items() if label.endswith('#2'))
+        assert failed['pools'] == 1
+        assert failed['idle_connections'] == 0
+        assert kept['idle_connections'] == 1
+        assert kept['total_connections_opened'] == 1
+        assert kept['total_requests'] == 2
+    finally:
+        registry.clear()
+        server.shutdown()
+        server.server_close()
+
+def test_env_number_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv('NLPIAM_TEST_NUMBER', 'abc')
+    with pytest.warns(UserWarning):
+        assert config._env_number('NLPIAM_TEST_NUMBER', 10, int, 1) == 10
+
+    monkeypatch.setenv('NLPIAM_TEST_NUMBER', '0')
+    with pytest.warns(UserWarning):
+        assert config._env_number('NLPIAM_TEST_NUMBER', 10, int, 1) == 10
+
+    monkeypatch.setenv('NLPIAM_TEST_NUMBER', '25')
+    assert config._env_number('NLPIAM_TEST_NUMBER', 10, int, 1) == 25
+
+def test_env_choice_rejects_unknown_retry_mode(monkeypatch):
+    monkeypatch.setenv('NLPIAM_RETRY_MODE', 'bogus')
+    with pytest.warns(UserWarning):
+        assert config._env_choice('NLPIAM_RETRY_MODE', 'standard', config.RETRY_MODES) == 'standard'
+
+    monkeypatch.setenv('NLPIAM_RETRY_MODE', 'Adaptive')
+    assert config._env_choice('NLPIAM_RETRY_MODE', 'standard', config.RETRY_MODES) == 'adaptive'
+
+def test_env_number_rejects_zero_and_infinite_timeouts(monkeypatch):
+    for value in ('0', 'inf', 'nan'):
+        monkeypatch.setenv('NLPIAM_TEST_TIMEOUT', value)
+        with pytest.warns(UserWarning):
+            assert config._env_number('NLPIAM_TEST_TIMEOUT', 5.0, float, 0, exclusive=True) == 5.0
+
+    monkeypatch.setenv('NLPIAM_TEST_TIMEOUT', '0.5')
+    assert config._env_number('NLPIAM_TEST_TIMEOUT', 5.0, float, 0, exclusive=True) == 0.5
+
+def test_env_bool_warns_on_unknown_values(monkeypatch):
+    monkeypatch.setenv('NLPIAM_TCP_KEEPALIVE', 'ture')
+    with pytest.warns(UserWarning):
+        assert config._env_bool('NLPIAM_TCP_KEEPALIVE', True) is True
+
+    monkeypatch.setenv('NLPIAM_TCP_KEEPALIVE', 'No')
+    assert config._env_bool('NLPIAM_TCP_KEEPALIVE', True) is False